@@ -9,10 +9,11 @@ Usage (multi-device):
     python monitor_serial.py /dev/ttyACM0,/dev/ttyACM1 10
 """
 
+import os
+import selectors
 import serial
 import sys
 import time
-import threading
 
 
 # ANSI color codes for device labeling
@@ -26,31 +27,68 @@ COLORS = [
 ]
 RESET = '\033[0m'
 
+# Upper bound on how long a blocking read may wait before re-checking the
+# monitoring deadline.
+READ_TIMEOUT = 0.1
+
+
+def write_stdout(data: bytes):
+    """Write straight to the stdout fd, bypassing sys.stdout's buffer and lock.
+
+    Anything still buffered in sys.stdout must be flushed before the first call
+    so header lines are not reordered after device output.
+    """
+    fd = sys.stdout.fileno()
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def write_lines(prefix: str, carry: bytes, data: bytes) -> bytes:
+    """Write each complete line in data with prefix; return the partial tail.
+
+    Lines are split on the raw bytes so only complete lines are decoded and a
+    multi-byte character straddling two reads is never cut in half.
+    """
+    *lines, carry = (carry + data).split(b'\n')
+    if lines:
+        write_stdout(''.join(
+            f"{prefix}{line.decode('utf-8', errors='ignore')}\n" for line in lines).encode())
+    return carry
+
+
+def flush_carry(prefix: str, carry: bytes):
+    """Write a trailing partial line left over when a device stops sending."""
+    if carry:
+        write_stdout(f"{prefix}{carry.decode('utf-8', errors='ignore')}\n".encode())
+
 
 def monitor_single(port: str, duration: int, baudrate: int = 115200,
                     label: str = "", color: str = ""):
     """Read serial output from one ESP32 device."""
     try:
-        ser = serial.Serial(port, baudrate, timeout=1)
+        ser = serial.Serial(port, baudrate, timeout=READ_TIMEOUT)
         prefix = f"{color}[{label}]{RESET} " if label else ""
-
-        start = time.time()
-        line_buffer = ""
-        while time.time() - start < duration:
-            if ser.in_waiting:
-                data = ser.read(ser.in_waiting).decode('utf-8', errors='ignore')
-                # Print with device prefix on each line
-                for ch in data:
-                    if ch == '\n':
-                        print(f"{prefix}{line_buffer}")
-                        line_buffer = ""
-                    else:
-                        line_buffer += ch
-            time.sleep(0.05)
+        sys.stdout.flush()
+
+        deadline = time.monotonic() + duration
+        line_buffer = b""
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            # Block until at least one byte arrives (or the timeout expires),
+            # then drain whatever else is already buffered.
+            ser.timeout = min(READ_TIMEOUT, remaining)
+            data = ser.read(ser.in_waiting or 1)
+            if not data:
+                continue
+            # Print with device prefix on each complete line; the trailing
+            # partial line is carried over to the next chunk
+            line_buffer = write_lines(prefix, line_buffer, data)
 
         # Flush remaining buffer
-        if line_buffer:
-            print(f"{prefix}{line_buffer}")
+        flush_carry(prefix, line_buffer)
 
         ser.close()
         return 0
@@ -68,43 +106,62 @@ def monitor(ports_str: str = "/dev/ttyACM0", duration: int = 10, baudrate: int =
         port = ports[0]
         print(f"Monitoring {port} at {baudrate} baud for {duration}s...")
         print("-" * 50)
-        try:
-            ser = serial.Serial(port, baudrate, timeout=1)
-            start = time.time()
-            while time.time() - start < duration:
-                if ser.in_waiting:
-                    data = ser.read(ser.in_waiting)
-                    print(data.decode('utf-8', errors='ignore'), end='', flush=True)
-                time.sleep(0.05)
-            print("\n" + "-" * 50)
-            print("Monitoring complete.")
-            ser.close()
-            return 0
-        except serial.SerialException as e:
-            print(f"Error: {e}", file=sys.stderr)
-            return 1
+        rc = monitor_single(port, duration, baudrate)
+        if rc:
+            return rc
+        print("-" * 50)
+        print("Monitoring complete.")
+        return 0
     else:
-        # Multi-device - threaded monitoring with colored labels
+        # Multi-device - one selector loop services every port
         print(f"Monitoring {len(ports)} devices at {baudrate} baud for {duration}s...")
         for i, port in enumerate(ports):
             color = COLORS[i % len(COLORS)]
             print(f"  {color}[dev{i}]{RESET} {port}")
         print("-" * 50)
 
-        threads = []
-        for i, port in enumerate(ports):
-            label = f"dev{i}"
-            color = COLORS[i % len(COLORS)]
-            t = threading.Thread(
-                target=monitor_single,
-                args=(port, duration, baudrate, label, color),
-                daemon=True,
-            )
-            threads.append(t)
-            t.start()
-
-        for t in threads:
-            t.join(timeout=duration + 5)
+        sel = selectors.DefaultSelector()
+        serials = []
+        try:
+            for i, port in enumerate(ports):
+                color = COLORS[i % len(COLORS)]
+                try:
+                    ser = serial.Serial(port, baudrate, timeout=0)
+                except serial.SerialException as e:
+                    print(f"Error on {port}: {e}", file=sys.stderr)
+                    continue
+                serials.append(ser)
+                # [prefix, partial line carried between reads]
+                sel.register(ser.fileno(), selectors.EVENT_READ,
+                             data=[f"{color}[dev{i}]{RESET} ", b""])
+
+            sys.stdout.flush()
+            deadline = time.monotonic() + duration
+            while sel.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for key, _ in sel.select(timeout=remaining):
+                    state = key.data
+                    try:
+                        data = os.read(key.fd, 4096)
+                    except OSError as e:
+                        print(f"Error on {state[0]}: {e}", file=sys.stderr)
+                        data = b""
+                    if not data:
+                        # Device went away
+                        flush_carry(*state)
+                        sel.unregister(key.fd)
+                        continue
+                    state[1] = write_lines(state[0], state[1], data)
+
+            # Flush remaining buffers
+            for key in sel.get_map().values():
+                flush_carry(*key.data)
+        finally:
+            sel.close()
+            for ser in serials:
+                ser.close()
 
         print("-" * 50)
         print("Monitoring complete.")
@@ -129,6 +129,11 @@ void TcpConfigServer::run() {
             continue;
         }
 
+        // Responses are small request/reply frames; don't let Nagle hold
+        // them back waiting on the host's delayed ACK
+        int noDelay = 1;
+        setsockopt(clientSock, IPPROTO_TCP, TCP_NODELAY, &noDelay, sizeof(noDelay));
+
         clientCount_.fetch_add(1);
         TRACE_INSTANT(TRACE_ID("TcpServer.ClientConnect"), domes::trace::Category::kTransport);
 
@@ -14,21 +14,34 @@ The device can be configured to use this server by calling:
 """
 
 import argparse
+import functools
+import gzip
 import hashlib
 import json
 import os
+import shutil
 import sys
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse
 
 
+@functools.lru_cache(maxsize=8)
+def _hash_firmware(firmware_path: str, mtime_ns: int, size: int) -> str:
+    """Hash firmware in chunks; keyed on stat so a rebuilt binary is rehashed once."""
+    h = hashlib.sha256()
+    with open(firmware_path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            h.update(chunk)
+    return h.hexdigest()
+
+
 def get_firmware_sha256(firmware_path: str) -> str:
     """Calculate SHA-256 hash of firmware binary."""
-    if not os.path.exists(firmware_path):
+    try:
+        st = os.stat(firmware_path)
+    except FileNotFoundError:
         return "0" * 64
-
-    with open(firmware_path, "rb") as f:
-        return hashlib.sha256(f.read()).hexdigest()
+    return _hash_firmware(firmware_path, st.st_mtime_ns, st.st_size)
 
 
 def get_firmware_size(firmware_path: str) -> int:
@@ -38,12 +51,68 @@ def get_firmware_size(firmware_path: str) -> int:
     return os.path.getsize(firmware_path)
 
 
+@functools.lru_cache(maxsize=8)
+def _build_release_body(firmware_path: str, mtime_ns, size: int, version: str, host: str) -> tuple:
+    """Build the release JSON; keyed on stat so a rebuilt binary is picked up."""
+    firmware_sha256 = get_firmware_sha256(firmware_path)
+
+    response = {
+        "tag_name": version,
+        "name": f"DOMES Firmware {version}",
+        "body": f"## Changelog\n\n- New features\n- Bug fixes\n\nSHA-256: {firmware_sha256}",
+        "draft": False,
+        "prerelease": False,
+        "assets": [
+            {
+                "name": "domes.bin",
+                "browser_download_url": f"http://{host}/download/domes.bin",
+                "size": size,
+                "content_type": "application/octet-stream"
+            }
+        ]
+    }
+
+    body = json.dumps(response, separators=(",", ":")).encode("utf-8")
+    return size, body, gzip.compress(body, compresslevel=1)
+
+
+def get_release_body(firmware_path: str, version: str, host: str) -> tuple:
+    """Return (firmware size, JSON body, gzipped body), rebuilt only when inputs change."""
+    try:
+        st = os.stat(firmware_path)
+    except FileNotFoundError:
+        return _build_release_body(firmware_path, None, 0, version, host)
+    return _build_release_body(firmware_path, st.st_mtime_ns, st.st_size, version, host)
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Return True if an Accept-Encoding header allows gzip (q=0 refuses it)."""
+    qvalues = {}
+    for entry in accept_encoding.split(","):
+        coding, *params = entry.split(";")
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qvalues[coding.strip().lower()] = q
+    # An explicit gzip entry takes precedence over the wildcard
+    return qvalues.get("gzip", qvalues.get("*", 0.0)) > 0
+
+
 class MockGithubHandler(BaseHTTPRequestHandler):
     """Handler for mock GitHub API requests."""
 
     firmware_path: str = "build/domes.bin"
     version: str = "v1.1.0"
 
+    # Keep connections open so a device can fetch release info and then the
+    # firmware without a new TCP handshake. Every response sets Content-Length.
+    protocol_version = "HTTP/1.1"
+
     def log_message(self, format, *args):
         """Override to provide cleaner logging."""
         print(f"[{self.address_string()}] {format % args}")
@@ -65,29 +134,16 @@ class MockGithubHandler(BaseHTTPRequestHandler):
     def send_release_info(self):
         """Send GitHub release JSON response."""
         host = self.headers.get("Host", "localhost:8080")
-        firmware_size = get_firmware_size(self.firmware_path)
-        firmware_sha256 = get_firmware_sha256(self.firmware_path)
-
-        response = {
-            "tag_name": self.version,
-            "name": f"DOMES Firmware {self.version}",
-            "body": f"## Changelog\n\n- New features\n- Bug fixes\n\nSHA-256: {firmware_sha256}",
-            "draft": False,
-            "prerelease": False,
-            "assets": [
-                {
-                    "name": "domes.bin",
-                    "browser_download_url": f"http://{host}/download/domes.bin",
-                    "size": firmware_size,
-                    "content_type": "application/octet-stream"
-                }
-            ]
-        }
-
-        body = json.dumps(response, indent=2).encode("utf-8")
+        firmware_size, body, gzipped = get_release_body(self.firmware_path, self.version, host)
+        use_gzip = accepts_gzip(self.headers.get("Accept-Encoding", ""))
+        if use_gzip:
+            body = gzipped
 
         self.send_response(200)
         self.send_header("Content-Type", "application/json")
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Vary", "Accept-Encoding")
         self.send_header("Content-Length", len(body))
         self.end_headers()
         self.wfile.write(body)
@@ -96,21 +152,35 @@ class MockGithubHandler(BaseHTTPRequestHandler):
 
     def send_firmware(self):
         """Send firmware binary."""
-        if not os.path.exists(self.firmware_path):
+        try:
+            f = open(self.firmware_path, "rb")
+        except FileNotFoundError:
             self.send_error(404, f"Firmware not found: {self.firmware_path}")
             return
 
-        with open(self.firmware_path, "rb") as f:
-            data = f.read()
-
-        self.send_response(200)
-        self.send_header("Content-Type", "application/octet-stream")
-        self.send_header("Content-Length", len(data))
-        self.send_header("Content-Disposition", 'attachment; filename="domes.bin"')
-        self.end_headers()
-        self.wfile.write(data)
-
-        print(f"Served firmware: {len(data)} bytes")
+        with f:
+            size = os.fstat(f.fileno()).st_size
+
+            self.send_response(200)
+            self.send_header("Content-Type", "application/octet-stream")
+            self.send_header("Content-Length", size)
+            self.send_header("Content-Disposition", 'attachment; filename="domes.bin"')
+            self.end_headers()
+            self.wfile.flush()
+
+            # Let the kernel copy the file straight into the socket
+            try:
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(self.wfile.fileno(), f.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except (AttributeError, OSError):
+                f.seek(offset)
+                shutil.copyfileobj(f, self.wfile, 1 << 20)
+
+        print(f"Served firmware: {size} bytes")
 
     def send_health(self):
         """Send health check response."""
@@ -165,8 +235,10 @@ def main():
     print("Press Ctrl+C to stop")
     print()
 
-    # Start server
-    server = HTTPServer((args.host, args.port), MockGithubHandler)
+    # Start server (one thread per connection so a slow download does not
+    # block release polls from other pods)
+    server = ThreadingHTTPServer((args.host, args.port), MockGithubHandler)
+    server.daemon_threads = True
 
     try:
         server.serve_forever()
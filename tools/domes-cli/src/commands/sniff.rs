@@ -3,10 +3,9 @@
 //! Captures and decodes DOMES protocol frames on any transport.
 //! Prints human-readable decoded output, raw hex, or JSON lines.
 
-use crate::transport::frame::{Frame, FrameDecoder};
+use crate::transport::frame::{Frame, FrameReader};
 use anyhow::{Context, Result};
 use prost::Message;
-use std::io::Read;
 use std::time::{Duration, Instant};
 
 /// Protocol filter categories
@@ -77,48 +76,42 @@ pub fn sniff_serial(port_name: &str, opts: &SniffOptions) -> Result<()> {
     eprintln!("Sniffing on {} (press Ctrl+C to stop)", port_name);
     eprintln!();
 
-    let mut decoder = FrameDecoder::new();
+    let mut frames = FrameReader::new();
     let start = Instant::now();
-    let mut buf = [0u8; 256];
     let mut frame_count = 0u32;
     let mut reader = port;
 
     loop {
-        match reader.read(&mut buf) {
-            Ok(0) => {
-                std::thread::sleep(Duration::from_millis(1));
-                continue;
-            }
-            Ok(n) => {
-                for &byte in &buf[..n] {
-                    if let Some(result) = decoder.feed_byte(byte) {
-                        match result {
-                            Ok(frame) => {
-                                let elapsed = start.elapsed();
-                                if should_display(&frame, &opts.filters) {
-                                    let decoded = decode_frame(elapsed, &frame);
-                                    display_frame(&decoded, opts.format);
-                                    frame_count += 1;
-
-                                    if let Some(max) = opts.count {
-                                        if frame_count >= max {
-                                            eprintln!(
-                                                "\nCaptured {} frame(s), stopping.",
-                                                frame_count
-                                            );
-                                            return Ok(());
-                                        }
-                                    }
-                                }
-                            }
-                            Err(e) => {
-                                eprintln!("[FRAME ERROR] {}", e);
+        while let Some(result) = frames.next_buffered() {
+            match result {
+                Ok(frame) => {
+                    let elapsed = start.elapsed();
+                    if should_display(&frame, &opts.filters) {
+                        let decoded = decode_frame(elapsed, &frame);
+                        display_frame(&decoded, opts.format);
+                        frame_count += 1;
+
+                        if let Some(max) = opts.count {
+                            if frame_count >= max {
+                                eprintln!("\nCaptured {} frame(s), stopping.", frame_count);
+                                return Ok(());
                             }
                         }
-                        decoder.reset();
                     }
                 }
+                Err(e) => {
+                    eprintln!("[FRAME ERROR] {}", e);
+                }
             }
+            frames.reset();
+        }
+
+        match frames.fill(&mut reader) {
+            Ok(0) => {
+                std::thread::sleep(Duration::from_millis(1));
+                continue;
+            }
+            Ok(_) => {}
             Err(e) if e.kind() == std::io::ErrorKind::TimedOut => {
                 continue;
             }
@@ -496,14 +489,23 @@ fn display_raw(frame: &DecodedFrame) {
         ts, frame.msg_type, frame.msg_name, frame.payload_size,
     );
     if !frame.raw_payload.is_empty() {
-        // Hex dump in 16-byte rows
+        use std::fmt::Write as _;
+
+        // Hex dump in 16-byte rows, reusing one line buffer
+        let mut hex = String::with_capacity(48);
         for (i, chunk) in frame.raw_payload.chunks(16).enumerate() {
-            let hex: Vec<String> = chunk.iter().map(|b| format!("{:02x}", b)).collect();
+            hex.clear();
+            for (j, b) in chunk.iter().enumerate() {
+                if j > 0 {
+                    hex.push(' ');
+                }
+                let _ = write!(hex, "{:02x}", b);
+            }
             let ascii: String = chunk
                 .iter()
                 .map(|&b| if (0x20..=0x7e).contains(&b) { b as char } else { '.' })
                 .collect();
-            println!("  {:04x}  {:<48}  {}", i * 16, hex.join(" "), ascii);
+            println!("  {:04x}  {:<48}  {}", i * 16, hex, ascii);
         }
     }
     println!();
@@ -521,7 +523,7 @@ fn display_json(frame: &DecodedFrame) {
         fields_json.push_str(&format!("\"{}\":\"{}\"", k, escaped_v));
     }
 
-    let raw_hex: String = frame.raw_payload.iter().map(|b| format!("{:02x}", b)).collect();
+    let raw_hex = hex::encode(&frame.raw_payload);
 
     println!(
         "{{\"ts_us\":{},\"msg_type\":\"0x{:02X}\",\"msg_name\":\"{}\",\"direction\":\"{}\",\"protocol\":\"{}\",\"payload_size\":{},\"fields\":{{{}}},\"raw\":\"{}\"}}",
@@ -553,7 +555,7 @@ fn mode_name(mode: i32) -> String {
 #[cfg(test)]
 mod tests {
     use super::*;
-    use crate::transport::frame::encode_frame;
+    use crate::transport::frame::{encode_frame, FrameDecoder};
 
     #[test]
     fn test_protocol_filter_matches() {
@@ -12,7 +12,7 @@ use anyhow::{Context, Result};
 use prost::Message;
 use std::collections::HashMap;
 use std::fs::File;
-use std::io::Write;
+use std::io::{BufWriter, Write};
 use std::path::Path;
 
 /// Compact trace event (16 bytes, binary)
@@ -27,6 +27,21 @@ struct TraceEvent {
     arg2: u32,
 }
 
+impl TraceEvent {
+    /// Size of one binary event on the wire
+    const SIZE: usize = std::mem::size_of::<TraceEvent>();
+
+    /// Iterate over the events packed in a data chunk
+    ///
+    /// A trailing partial record is ignored.
+    fn parse_all(bytes: &[u8]) -> impl ExactSizeIterator<Item = TraceEvent> + '_ {
+        bytes.chunks_exact(Self::SIZE).map(|record| {
+            // SAFETY: record is exactly SIZE bytes and TraceEvent is packed POD
+            unsafe { std::ptr::read_unaligned(record.as_ptr() as *const TraceEvent) }
+        })
+    }
+}
+
 /// Trace status information
 #[derive(Debug)]
 pub struct TraceStatusInfo {
@@ -190,14 +205,13 @@ pub fn trace_dump(
     }
 
     // Parse session info (protobuf)
-    let session_info = TraceSessionInfo::decode(frame.payload.as_slice())
+    let mut session_info = TraceSessionInfo::decode(frame.payload.as_slice())
         .context("Failed to decode TraceSessionInfo")?;
 
-    // Build task name lookup
-    let task_names: HashMap<u32, String> = session_info
-        .tasks
-        .iter()
-        .map(|t| (t.task_id, t.name.clone()))
+    // Build task name lookup, moving the decoded names rather than copying them
+    let task_names: HashMap<u32, String> = std::mem::take(&mut session_info.tasks)
+        .into_iter()
+        .map(|t| (t.task_id, t.name))
         .collect();
 
     // Collect all events
@@ -215,22 +229,9 @@ pub fn trace_dump(
                 .context("Failed to decode TraceDataChunk")?;
 
             // Extract binary events from bytes field
-            let event_bytes = &chunk.events;
-            let event_size = std::mem::size_of::<TraceEvent>();
-            let event_count = event_bytes.len() / event_size;
-
-            for i in 0..event_count {
-                let offset = i * event_size;
-                if offset + event_size <= event_bytes.len() {
-                    let event = unsafe {
-                        std::ptr::read_unaligned(
-                            event_bytes[offset..].as_ptr() as *const TraceEvent,
-                        )
-                    };
-                    events.push(event);
-                    total_received += 1;
-                }
-            }
+            let parsed = TraceEvent::parse_all(&chunk.events);
+            total_received += parsed.len() as u32;
+            events.extend(parsed);
         } else if frame.msg_type == TraceMsgType::End.as_u8() {
             // Parse dump complete (protobuf)
             let _end = TraceDumpComplete::decode(frame.payload.as_slice())
@@ -244,19 +245,18 @@ pub fn trace_dump(
         }
     }
 
-    // Convert to Chrome JSON trace format for Perfetto
-    let json = convert_to_perfetto_json(
+    // Write Chrome JSON trace format for Perfetto
+    let file = File::create(output_path).context("Failed to create output file")?;
+    let mut out = BufWriter::new(file);
+    write_perfetto_json(
+        &mut out,
         &events,
         &task_names,
         &span_names,
         session_info.pod_id,
-    )?;
-
-    // Write to file
-    let mut file =
-        File::create(output_path).context("Failed to create output file")?;
-    file.write_all(json.as_bytes())
-        .context("Failed to write trace file")?;
+    )
+    .context("Failed to write trace file")?;
+    out.flush().context("Failed to write trace file")?;
 
     Ok(DumpResult {
         event_count: total_received,
@@ -310,21 +310,23 @@ fn load_span_names(names_path: Option<&Path>) -> Result<HashMap<u32, String>> {
     Ok(names)
 }
 
-/// Convert trace events to Perfetto-compatible Chrome JSON format
-fn convert_to_perfetto_json(
+/// Write trace events as Perfetto-compatible Chrome JSON
+///
+/// Events are encoded straight into `out`, so the document is never held in
+/// memory as a whole.
+fn write_perfetto_json<W: Write>(
+    out: &mut W,
     events: &[TraceEvent],
     task_names: &HashMap<u32, String>,
     span_names: &HashMap<u32, String>,
     pod_id: u32,
-) -> Result<String> {
-    use std::fmt::Write;
-
-    let mut json = String::from("[");
+) -> Result<()> {
+    out.write_all(b"[")?;
     let mut first = true;
 
     for event in events {
         if !first {
-            json.push(',');
+            out.write_all(b",")?;
         }
         first = false;
 
@@ -336,98 +338,42 @@ fn convert_to_perfetto_json(
         let arg1 = { event.arg1 };
         let arg2 = { event.arg2 };
 
-        let task_name = task_names
-            .get(&(task_id as u32))
-            .map(|s| s.as_str())
-            .unwrap_or("unknown");
         let category = category_name((flags >> 4) & 0x0F);
-
-        // Chrome trace event format
-        let phase = match event_type {
-            0x20 => "B", // SPAN_BEGIN -> Begin
-            0x21 => "E", // SPAN_END -> End
-            0x22 => "i", // INSTANT -> Instant
-            0x23 => "C", // COUNTER -> Counter
-            0x24 => "X", // COMPLETE -> Complete (duration in arg2)
-            0x01 => "B", // TASK_SWITCH_IN -> Begin
-            0x02 => "E", // TASK_SWITCH_OUT -> End
-            0x05 => "B", // ISR_ENTER -> Begin
-            0x06 => "E", // ISR_EXIT -> End
-            0x09 => "B", // MUTEX_LOCK -> Begin (lock held)
-            0x0A => "E", // MUTEX_UNLOCK -> End (lock released)
-            0x0B => "i", // MUTEX_CONTENTION -> Instant (with wait time)
-            0x0C => "i", // SEM_TAKE -> Instant
-            0x0D => "i", // SEM_GIVE -> Instant
-            _ => "i",    // Default to instant
-        };
-
-        // Resolve span name from hash
-        let name = match event_type {
-            0x01 | 0x02 => format!("task:{}", task_name),
-            0x05 | 0x06 => format!("isr:{}", arg1),
-            0x09 | 0x0A => {
-                // Mutex lock/unlock: resolve name from hash
-                span_names
-                    .get(&arg1)
-                    .cloned()
-                    .unwrap_or_else(|| format!("mutex:{}", arg1))
-            }
-            0x0B => {
-                // Mutex contention: resolve name, arg2 = wait time us
-                span_names
-                    .get(&arg1)
-                    .cloned()
-                    .unwrap_or_else(|| format!("mutex:{}", arg1))
-            }
-            0x0C | 0x0D => {
-                // Semaphore take/give: resolve name from hash
-                span_names
-                    .get(&arg1)
-                    .cloned()
-                    .unwrap_or_else(|| format!("sem:{}", arg1))
+        let format = event_format(event_type);
+
+        // Resolve the name straight into the output, without a String per event
+        out.write_all(br#"{"name":""#)?;
+        match format.naming {
+            EventNaming::Task => {
+                let task_name = task_names
+                    .get(&(task_id as u32))
+                    .map(|s| s.as_str())
+                    .unwrap_or("unknown");
+                write!(out, "task:{}", task_name)?;
             }
-            0x23 => {
-                // Counter: resolve name from hash
-                span_names
-                    .get(&arg1)
-                    .cloned()
-                    .unwrap_or_else(|| format!("counter:{}", arg1))
-            }
-            _ => {
-                // Span/instant: resolve name from hash
-                span_names
-                    .get(&arg1)
-                    .cloned()
-                    .unwrap_or_else(|| format!("span:{}", arg1))
-            }
-        };
+            EventNaming::Isr => write!(out, "isr:{}", arg1)?,
+            EventNaming::Hash(kind) => match span_names.get(&arg1) {
+                Some(name) => out.write_all(name.as_bytes())?,
+                None => write!(out, "{}:{}", kind, arg1)?,
+            },
+        }
 
         write!(
-            &mut json,
-            r#"{{"name":"{}","cat":"{}","ph":"{}","ts":{},"pid":{},"tid":{}"#,
-            name, category, phase, timestamp, pod_id, task_id
+            out,
+            r#"","cat":"{}","ph":"{}","ts":{},"pid":{},"tid":{}"#,
+            category, format.phase, timestamp, pod_id, task_id
         )?;
 
-        // Add duration for complete events
-        if event_type == 0x24 {
-            write!(&mut json, r#","dur":{}"#, arg2)?;
-        }
-
-        // Add counter value
-        if event_type == 0x23 {
-            write!(&mut json, r#","args":{{"value":{}}}"#, arg2)?;
+        // Duration, counter value or contention wait time
+        if let Some((prefix, suffix)) = format.arg2 {
+            write!(out, "{}{}{}", prefix, arg2, suffix)?;
         }
 
-        // Add mutex contention wait time
-        if event_type == 0x0B {
-            write!(&mut json, r#","args":{{"wait_us":{}}}"#, arg2)?;
-        }
-
-        json.push('}');
+        out.write_all(b"}")?;
     }
 
-    json.push(']');
-    Ok(json)
+    out.write_all(b"]")?;
+    Ok(())
 }
 
 /// Stream trace events in real-time from a TCP connection
@@ -467,98 +413,132 @@ pub fn trace_stream(addr: &str) -> Result<()> {
     // Load span names for resolving
     let span_names = load_span_names(None).unwrap_or_default();
 
-    let mut frame_decoder = crate::transport::frame::FrameDecoder::new();
-    let mut buf = [0u8; 1024];
+    let mut frames = crate::transport::frame::FrameReader::new();
 
     loop {
-        use std::io::Read;
-        let n = match stream.read(&mut buf) {
+        // Handle every frame already buffered before reading more
+        while let Some(result) = frames.next_buffered() {
+            frames.reset();
+            let frame = match result {
+                Ok(frame) => frame,
+                Err(_) => continue,
+            };
+            if frame.msg_type == TraceMsgType::StreamData.as_u8() {
+                // Decode StreamBatch
+                if let Ok(batch) = StreamBatch::decode(frame.payload.as_slice()) {
+                    if batch.dropped > 0 {
+                        eprintln!("  [dropped {} events]", batch.dropped);
+                    }
+
+                    // Parse binary events
+                    for event in TraceEvent::parse_all(&batch.events) {
+                        let timestamp = { event.timestamp };
+                        let task_id = { event.task_id };
+                        let event_type = { event.event_type };
+                        let flags = { event.flags };
+                        let arg1 = { event.arg1 };
+                        let arg2 = { event.arg2 };
+
+                        let type_name = match event_type {
+                            0x20 => "BEGIN",
+                            0x21 => "END",
+                            0x22 => "INSTANT",
+                            0x23 => "COUNTER",
+                            0x24 => "COMPLETE",
+                            0x01 => "TASK_IN",
+                            0x02 => "TASK_OUT",
+                            _ => "UNKNOWN",
+                        };
+
+                        let cat = category_name((flags >> 4) & 0x0F);
+
+                        let name = span_names.get(&arg1).map(|s| s.as_str()).unwrap_or("");
+
+                        if event_type == 0x23 {
+                            // Counter
+                            println!(
+                                "{:<12} {:<6} {:<12} {:<12} {} = {}",
+                                timestamp, task_id, type_name, cat, name, arg2
+                            );
+                        } else {
+                            println!(
+                                "{:<12} {:<6} {:<12} {:<12} {:>10} {:>10}  {}",
+                                timestamp, task_id, type_name, cat, arg1, arg2, name
+                            );
+                        }
+                    }
+                }
+            }
+        }
+
+        match frames.fill(&mut stream) {
             Ok(0) => {
                 eprintln!("\nConnection closed by device");
                 break;
             }
-            Ok(n) => n,
-            Err(e) if e.kind() == std::io::ErrorKind::TimedOut
-                || e.kind() == std::io::ErrorKind::WouldBlock => {
+            Ok(_) => {}
+            Err(e)
+                if e.kind() == std::io::ErrorKind::TimedOut
+                    || e.kind() == std::io::ErrorKind::WouldBlock =>
+            {
                 continue;
             }
             Err(e) => {
                 return Err(anyhow::anyhow!("Read error: {}", e));
             }
-        };
-
-        // Feed bytes to frame decoder
-        for &byte in &buf[..n] {
-            if let Some(Ok(frame)) = frame_decoder.feed_byte(byte) {
-                frame_decoder.reset();
-                if frame.msg_type == TraceMsgType::StreamData.as_u8() {
-                    // Decode StreamBatch
-                    if let Ok(batch) = StreamBatch::decode(frame.payload.as_slice()) {
-                        if batch.dropped > 0 {
-                            eprintln!("  [dropped {} events]", batch.dropped);
-                        }
-
-                        // Parse binary events
-                        let event_size = std::mem::size_of::<TraceEvent>();
-                        let event_count = batch.events.len() / event_size;
-
-                        for i in 0..event_count {
-                            let offset = i * event_size;
-                            if offset + event_size <= batch.events.len() {
-                                let event = unsafe {
-                                    std::ptr::read_unaligned(
-                                        batch.events[offset..].as_ptr() as *const TraceEvent,
-                                    )
-                                };
-
-                                let timestamp = { event.timestamp };
-                                let task_id = { event.task_id };
-                                let event_type = { event.event_type };
-                                let flags = { event.flags };
-                                let arg1 = { event.arg1 };
-                                let arg2 = { event.arg2 };
-
-                                let type_name = match event_type {
-                                    0x20 => "BEGIN",
-                                    0x21 => "END",
-                                    0x22 => "INSTANT",
-                                    0x23 => "COUNTER",
-                                    0x24 => "COMPLETE",
-                                    0x01 => "TASK_IN",
-                                    0x02 => "TASK_OUT",
-                                    _ => "UNKNOWN",
-                                };
-
-                                let cat = category_name((flags >> 4) & 0x0F);
-
-                                let name = span_names
-                                    .get(&arg1)
-                                    .map(|s| s.as_str())
-                                    .unwrap_or("");
-
-                                if event_type == 0x23 {
-                                    // Counter
-                                    println!(
-                                        "{:<12} {:<6} {:<12} {:<12} {} = {}",
-                                        timestamp, task_id, type_name, cat, name, arg2
-                                    );
-                                } else {
-                                    println!(
-                                        "{:<12} {:<6} {:<12} {:<12} {:>10} {:>10}  {}",
-                                        timestamp, task_id, type_name, cat, arg1, arg2, name
-                                    );
-                                }
-                            }
-                        }
-                    }
-                }
-            }
         }
     }
 
     Ok(())
 }
 
+/// How an event's name is produced in the Chrome JSON output
+enum EventNaming {
+    /// "task:<task name>"
+    Task,
+    /// "isr:<arg1>"
+    Isr,
+    /// Span name for the arg1 hash, or "<kind>:<arg1>" if unknown
+    Hash(&'static str),
+}
+
+/// Chrome trace rendering for one event type
+struct EventFormat {
+    phase: &'static str,
+    naming: EventNaming,
+    /// JSON fragment wrapped around arg2, if the event carries it
+    arg2: Option<(&'static str, &'static str)>,
+}
+
+/// Look up how to render an event type, in a single dispatch per event
+fn event_format(event_type: u8) -> EventFormat {
+    use EventNaming::{Hash, Isr, Task};
+
+    let (phase, naming, arg2) = match event_type {
+        0x20 => ("B", Hash("span"), None), // SPAN_BEGIN -> Begin
+        0x21 => ("E", Hash("span"), None), // SPAN_END -> End
+        0x22 => ("i", Hash("span"), None), // INSTANT -> Instant
+        0x23 => ("C", Hash("counter"), Some((r#","args":{"value":"#, "}"))), // COUNTER
+        0x24 => ("X", Hash("span"), Some((r#","dur":"#, ""))), // COMPLETE (duration in arg2)
+        0x01 => ("B", Task, None),         // TASK_SWITCH_IN -> Begin
+        0x02 => ("E", Task, None),         // TASK_SWITCH_OUT -> End
+        0x05 => ("B", Isr, None),          // ISR_ENTER -> Begin
+        0x06 => ("E", Isr, None),          // ISR_EXIT -> End
+        0x09 => ("B", Hash("mutex"), None), // MUTEX_LOCK -> Begin (lock held)
+        0x0A => ("E", Hash("mutex"), None), // MUTEX_UNLOCK -> End (lock released)
+        0x0B => ("i", Hash("mutex"), Some((r#","args":{"wait_us":"#, "}"))), // MUTEX_CONTENTION
+        0x0C => ("i", Hash("sem"), None),  // SEM_TAKE -> Instant
+        0x0D => ("i", Hash("sem"), None),  // SEM_GIVE -> Instant
+        _ => ("i", Hash("span"), None),    // Default to instant
+    };
+
+    EventFormat {
+        phase,
+        naming,
+        arg2,
+    }
+}
+
 fn category_name(cat: u8) -> &'static str {
     match cat {
         0 => "kernel",
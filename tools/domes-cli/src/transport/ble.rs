@@ -3,7 +3,7 @@
 //! Handles Bluetooth Low Energy communication with the ESP32-S3 device.
 //! Uses btleplug for BLE Central role (connecting to the device as peripheral).
 
-use super::frame::{encode_frame, Frame, FrameDecoder};
+use super::frame::{encode_frame, Frame, FrameReader};
 use anyhow::{bail, Context, Result};
 use btleplug::api::{
     Central, Characteristic, Manager as _, Peripheral as _, ScanFilter, WriteType,
@@ -55,7 +55,7 @@ pub struct BleTransport {
     data_char: Characteristic,
     status_char: Characteristic,
     rx_receiver: Receiver<Vec<u8>>,
-    decoder: FrameDecoder,
+    reader: FrameReader,
     device_name: String,
     auto_reconnect: bool,
 }
@@ -141,7 +141,7 @@ impl BleTransport {
             data_char,
             status_char,
             rx_receiver,
-            decoder: FrameDecoder::new(),
+            reader: FrameReader::new(),
             device_name,
             auto_reconnect,
         })
@@ -248,26 +248,24 @@ impl BleTransport {
 
     /// Receive a frame from the device with timeout
     pub fn receive_frame(&mut self, timeout_ms: u64) -> Result<Frame> {
-        self.decoder.reset();
+        self.reader.reset();
 
         let timeout = Duration::from_millis(timeout_ms);
         let start = Instant::now();
 
         loop {
+            // Notifications may carry more than one frame; leftovers stay buffered
+            if let Some(result) = self.reader.next_buffered() {
+                return result.map_err(|e| anyhow::anyhow!("Frame decode error: {}", e));
+            }
+
             let remaining = timeout.saturating_sub(start.elapsed());
             if remaining.is_zero() {
                 bail!("Timeout waiting for BLE response");
             }
 
             match self.rx_receiver.recv_timeout(remaining) {
-                Ok(data) => {
-                    for byte in data {
-                        if let Some(result) = self.decoder.feed_byte(byte) {
-                            return result
-                                .map_err(|e| anyhow::anyhow!("Frame decode error: {}", e));
-                        }
-                    }
-                }
+                Ok(data) => self.reader.feed(&data),
                 Err(crossbeam_channel::RecvTimeoutError::Timeout) => {
                     bail!("Timeout waiting for BLE response");
                 }
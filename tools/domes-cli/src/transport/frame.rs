@@ -8,6 +8,7 @@
 //! - CRC32: 4 bytes little-endian, calculated over (Type + Payload)
 
 use crc32fast::Hasher;
+use std::io::{self, Read};
 use thiserror::Error;
 
 /// Frame start marker bytes
@@ -37,6 +38,20 @@ pub enum FrameError {
 ///
 /// Returns the encoded frame as a Vec<u8>
 pub fn encode_frame(msg_type: u8, payload: &[u8]) -> Result<Vec<u8>, FrameError> {
+    let mut frame = Vec::with_capacity(FRAME_OVERHEAD + payload.len());
+    encode_frame_into(msg_type, payload, &mut frame)?;
+    Ok(frame)
+}
+
+/// Encode a frame into a caller-owned buffer
+///
+/// The buffer is cleared first, so a transport can reuse one allocation
+/// for every frame it sends.
+pub fn encode_frame_into(
+    msg_type: u8,
+    payload: &[u8],
+    frame: &mut Vec<u8>,
+) -> Result<(), FrameError> {
     if payload.len() > MAX_PAYLOAD_SIZE {
         return Err(FrameError::PayloadTooLarge(payload.len()));
     }
@@ -51,8 +66,8 @@ pub fn encode_frame(msg_type: u8, payload: &[u8]) -> Result<Vec<u8>, FrameError>
     let crc = hasher.finalize();
 
     // Build frame
-    let frame_size = FRAME_OVERHEAD + payload.len();
-    let mut frame = Vec::with_capacity(frame_size);
+    frame.clear();
+    frame.reserve(FRAME_OVERHEAD + payload.len());
 
     // Start bytes
     frame.push(START_BYTE_0);
@@ -70,7 +85,7 @@ pub fn encode_frame(msg_type: u8, payload: &[u8]) -> Result<Vec<u8>, FrameError>
     // CRC32 (little-endian)
     frame.extend_from_slice(&crc.to_le_bytes());
 
-    Ok(frame)
+    Ok(())
 }
 
 /// Decoded frame
@@ -136,6 +151,51 @@ impl FrameDecoder {
         self.payload_index = 0;
     }
 
+    /// Feed a slice of bytes to the decoder
+    ///
+    /// Noise before a start byte is skipped with a single scan, and once the
+    /// length field is known the payload is copied in bulk rather than a
+    /// byte at a time. Returns the number of bytes consumed and, if a
+    /// frame completed, its result. Bytes after the end of that frame are not
+    /// consumed.
+    pub fn feed(&mut self, data: &[u8]) -> (usize, Option<Result<Frame, FrameError>>) {
+        let mut i = 0;
+        while i < data.len() {
+            if self.state == DecoderState::WaitStart0 {
+                // Skip line noise in one scan instead of a byte at a time
+                match data[i..].iter().position(|&b| b == START_BYTE_0) {
+                    Some(pos) => {
+                        i += pos + 1;
+                        self.state = DecoderState::WaitStart1;
+                    }
+                    None => i = data.len(),
+                }
+                continue;
+            }
+
+            if self.state == DecoderState::WaitPayload {
+                let payload_len = (self.length - 1) as usize;
+                let take = (payload_len - self.payload_index).min(data.len() - i);
+                self.payload.extend_from_slice(&data[i..i + take]);
+                self.payload_index += take;
+                i += take;
+
+                if self.payload_index >= payload_len {
+                    self.state = DecoderState::WaitCrc;
+                    self.crc_index = 0;
+                }
+                continue;
+            }
+
+            let byte = data[i];
+            i += 1;
+            if let Some(result) = self.feed_byte(byte) {
+                return (i, Some(result));
+            }
+        }
+        (i, None)
+    }
+
     /// Feed a byte to the decoder
     ///
     /// Returns Some(Frame) when a complete frame is decoded, None otherwise
@@ -240,6 +300,95 @@ impl FrameDecoder {
     }
 }
 
+/// Buffered frame reader for byte-stream transports (serial, TCP)
+///
+/// Owns a decoder and a receive buffer large enough for one maximum-size
+/// frame. Bytes read past the end of a frame stay buffered and are decoded
+/// by the next call, so back-to-back frames are never dropped.
+pub struct FrameReader {
+    decoder: FrameDecoder,
+    buf: Vec<u8>,
+    /// buf[start..end] has been read but not yet decoded
+    start: usize,
+    end: usize,
+}
+
+impl Default for FrameReader {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+
+impl FrameReader {
+    /// Create a new frame reader
+    pub fn new() -> Self {
+        Self {
+            decoder: FrameDecoder::new(),
+            buf: vec![0; MAX_PAYLOAD_SIZE + FRAME_OVERHEAD],
+            start: 0,
+            end: 0,
+        }
+    }
+
+    /// Start decoding a new frame, keeping any buffered bytes
+    pub fn reset(&mut self) {
+        self.decoder.reset();
+    }
+
+    /// Decode from bytes already buffered
+    ///
+    /// Returns Some when a frame completed; None once the buffer is exhausted.
+    pub fn next_buffered(&mut self) -> Option<Result<Frame, FrameError>> {
+        if self.start == self.end {
+            return None;
+        }
+
+        let (consumed, result) = self.decoder.feed(&self.buf[self.start..self.end]);
+        self.start += consumed;
+        if self.start == self.end {
+            self.start = 0;
+            self.end = 0;
+        }
+        result
+    }
+
+    /// Append a chunk received out-of-band (e.g. a BLE notification)
+    ///
+    /// Bytes past the end of a completed frame stay buffered for the next
+    /// call to `next_buffered`.
+    pub fn feed(&mut self, data: &[u8]) {
+        self.compact();
+
+        let needed = self.end + data.len();
+        if needed > self.buf.len() {
+            self.buf.resize(needed, 0);
+        }
+        self.buf[self.end..needed].copy_from_slice(data);
+        self.end = needed;
+    }
+
+    /// Perform one read from `reader` into the buffer
+    ///
+    /// Returns the number of bytes read; 0 means the reader had no data
+    /// (serial) or reached end of stream (TCP), as interpreted by the caller.
+    pub fn fill<R: Read + ?Sized>(&mut self, reader: &mut R) -> io::Result<usize> {
+        self.compact();
+
+        let n = reader.read(&mut self.buf[self.end..])?;
+        self.end += n;
+        Ok(n)
+    }
+
+    /// Move unconsumed bytes to the front of the buffer
+    fn compact(&mut self) {
+        if self.start > 0 {
+            self.buf.copy_within(self.start..self.end, 0);
+            self.end -= self.start;
+            self.start = 0;
+        }
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -256,6 +405,17 @@ mod tests {
         assert_eq!(frame.len(), FRAME_OVERHEAD);
     }
 
+    #[test]
+    fn test_encode_into_reuses_buffer() {
+        let mut buf = Vec::new();
+        encode_frame_into(0x21, &[0x01, 0x02, 0x03, 0x04], &mut buf).unwrap();
+        let capacity = buf.capacity();
+
+        encode_frame_into(0x20, &[0x05], &mut buf).unwrap();
+        assert_eq!(buf, encode_frame(0x20, &[0x05]).unwrap());
+        assert_eq!(buf.capacity(), capacity);
+    }
+
     #[test]
     fn test_encode_decode_roundtrip() {
         let payload = [0x01, 0x02, 0x03, 0x04];
@@ -275,6 +435,81 @@ mod tests {
         assert_eq!(decoded.payload, payload);
     }
 
+    #[test]
+    fn test_feed_slice_stops_after_frame() {
+        let payload: Vec<u8> = (0..200).map(|i| i as u8).collect();
+        let mut stream = vec![0x00, 0x12];
+        stream.extend(encode_frame(0x22, &payload).unwrap());
+        let first_len = stream.len();
+        stream.extend(encode_frame(0x23, &[0x09]).unwrap());
+
+        let mut decoder = FrameDecoder::new();
+        let (consumed, result) = decoder.feed(&stream);
+        assert_eq!(consumed, first_len);
+        let frame = result.unwrap().unwrap();
+        assert_eq!(frame.msg_type, 0x22);
+        assert_eq!(frame.payload, payload);
+
+        // Remaining bytes decode as the second frame, even when split
+        decoder.reset();
+        let rest = &stream[consumed..];
+        let (n, result) = decoder.feed(&rest[..3]);
+        assert_eq!(n, 3);
+        assert!(result.is_none());
+        let (_, result) = decoder.feed(&rest[3..]);
+        let frame = result.unwrap().unwrap();
+        assert_eq!(frame.msg_type, 0x23);
+        assert_eq!(frame.payload, [0x09]);
+    }
+
+    #[test]
+    fn test_reader_keeps_bytes_between_frames() {
+        let mut stream = encode_frame(0x21, &[0x01, 0x02]).unwrap();
+        stream.extend(encode_frame(0x23, &[0x03]).unwrap());
+        let mut source = std::io::Cursor::new(stream);
+
+        let mut reader = FrameReader::new();
+        assert!(reader.next_buffered().is_none());
+        reader.fill(&mut source).unwrap();
+
+        let first = reader.next_buffered().unwrap().unwrap();
+        assert_eq!(first.msg_type, 0x21);
+        assert_eq!(first.payload, [0x01, 0x02]);
+
+        // Second frame arrived in the same read and is still buffered
+        reader.reset();
+        let second = reader.next_buffered().unwrap().unwrap();
+        assert_eq!(second.msg_type, 0x23);
+        assert_eq!(second.payload, [0x03]);
+
+        assert!(reader.next_buffered().is_none());
+        assert_eq!(reader.fill(&mut source).unwrap(), 0);
+    }
+
+    #[test]
+    fn test_reader_feed_split_chunks() {
+        let first = encode_frame(0x21, &[0x01, 0x02, 0x03]).unwrap();
+        let second = encode_frame(0x23, &[0x04]).unwrap();
+
+        // First chunk: all of frame one plus the start of frame two
+        let mut chunk = first.clone();
+        chunk.extend_from_slice(&second[..3]);
+
+        let mut reader = FrameReader::new();
+        reader.feed(&chunk);
+        let frame = reader.next_buffered().unwrap().unwrap();
+        assert_eq!(frame.msg_type, 0x21);
+        assert_eq!(frame.payload, [0x01, 0x02, 0x03]);
+
+        reader.reset();
+        assert!(reader.next_buffered().is_none());
+
+        reader.feed(&second[3..]);
+        let frame = reader.next_buffered().unwrap().unwrap();
+        assert_eq!(frame.msg_type, 0x23);
+        assert_eq!(frame.payload, [0x04]);
+    }
+
     #[test]
     fn test_crc_mismatch() {
         let mut frame = encode_frame(0x20, &[0x01]).unwrap();
@@ -315,4 +550,32 @@ mod tests {
 
         assert!(result.unwrap().is_ok());
     }
+
+    #[test]
+    fn test_invalid_length_rejected_at_header() {
+        // A corrupt 0xFFFF length must fail as soon as the header arrives,
+        // not after waiting for a body that will never come
+        let mut reader = FrameReader::new();
+        reader.feed(&[START_BYTE_0, START_BYTE_1, 0xFF, 0xFF]);
+
+        let result = reader.next_buffered().unwrap();
+        assert!(matches!(result, Err(FrameError::InvalidLength(0xFFFF))));
+    }
+
+    #[test]
+    fn test_feed_slice_skips_noise() {
+        let frame = encode_frame(0x20, &[0x07]).unwrap();
+
+        let mut decoder = FrameDecoder::new();
+        let (consumed, result) = decoder.feed(&[0x00, 0xFF, 0x12]);
+        assert_eq!(consumed, 3);
+        assert!(result.is_none());
+
+        // Lone start byte, then garbage, then the real frame
+        let mut data = vec![START_BYTE_0, 0x12, 0x34];
+        data.extend_from_slice(&frame);
+        let (consumed, result) = decoder.feed(&data);
+        assert_eq!(consumed, data.len());
+        assert_eq!(result.unwrap().unwrap().payload, [0x07]);
+    }
 }
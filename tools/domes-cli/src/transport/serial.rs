@@ -2,10 +2,10 @@
 //!
 //! Handles USB CDC communication with the ESP32-S3 device.
 
-use super::frame::{encode_frame, Frame, FrameDecoder};
+use super::frame::{encode_frame_into, Frame, FrameReader};
 use anyhow::{Context, Result};
 use serialport::SerialPort;
-use std::io::{Read, Write};
+use std::io::Write;
 use std::time::Duration;
 
 /// Default serial port settings
@@ -15,7 +15,9 @@ const DEFAULT_TIMEOUT_MS: u64 = 1000;
 /// Serial transport for communicating with DOMES device
 pub struct SerialTransport {
     port: Box<dyn SerialPort>,
-    decoder: FrameDecoder,
+    reader: FrameReader,
+    /// Reused buffer for outgoing frames
+    tx_buf: Vec<u8>,
 }
 
 impl SerialTransport {
@@ -28,15 +30,16 @@ impl SerialTransport {
 
         Ok(Self {
             port,
-            decoder: FrameDecoder::new(),
+            reader: FrameReader::new(),
+            tx_buf: Vec::new(),
         })
     }
 
     /// Send a frame to the device
     pub fn send_frame(&mut self, msg_type: u8, payload: &[u8]) -> Result<()> {
-        let frame = encode_frame(msg_type, payload)?;
+        encode_frame_into(msg_type, payload, &mut self.tx_buf)?;
         self.port
-            .write_all(&frame)
+            .write_all(&self.tx_buf)
             .context("Failed to write frame to serial port")?;
         self.port.flush().context("Failed to flush serial port")?;
         Ok(())
@@ -44,32 +47,27 @@ impl SerialTransport {
 
     /// Receive a frame from the device with timeout
     pub fn receive_frame(&mut self, timeout_ms: u64) -> Result<Frame> {
-        self.decoder.reset();
+        self.reader.reset();
 
         let start = std::time::Instant::now();
         let timeout = Duration::from_millis(timeout_ms);
 
-        let mut buf = [0u8; 1];
-
         loop {
+            // Buffered bytes may hold the start of this frame (or all of it)
+            if let Some(result) = self.reader.next_buffered() {
+                return result.map_err(|e| anyhow::anyhow!("Frame decode error: {}", e));
+            }
+
             if start.elapsed() > timeout {
                 anyhow::bail!("Timeout waiting for response");
             }
 
-            match self.port.read(&mut buf) {
-                Ok(1) => {
-                    if let Some(result) = self.decoder.feed_byte(buf[0]) {
-                        return result.map_err(|e| anyhow::anyhow!("Frame decode error: {}", e));
-                    }
-                }
+            match self.reader.fill(&mut self.port) {
                 Ok(0) => {
                     // No data available, continue waiting
                     std::thread::sleep(Duration::from_millis(1));
                 }
-                Ok(_) => {
-                    // Unexpected: more bytes than buffer size (shouldn't happen with 1-byte buffer)
-                    continue;
-                }
+                Ok(_) => {}
                 Err(e) if e.kind() == std::io::ErrorKind::TimedOut => {
                     // Timeout on read, continue loop and check overall timeout
                     continue;
@@ -2,9 +2,9 @@
 //!
 //! Handles WiFi communication with the ESP32-S3 device over TCP.
 
-use super::frame::{encode_frame, Frame, FrameDecoder};
+use super::frame::{encode_frame_into, Frame, FrameReader};
 use anyhow::{Context, Result};
-use std::io::{Read, Write};
+use std::io::Write;
 use std::net::{TcpStream, ToSocketAddrs};
 use std::time::Duration;
 
@@ -14,7 +14,11 @@ const DEFAULT_TIMEOUT_MS: u64 = 2000;
 /// TCP transport for communicating with DOMES device over WiFi
 pub struct TcpTransport {
     stream: TcpStream,
-    decoder: FrameDecoder,
+    reader: FrameReader,
+    /// Reused buffer for outgoing frames
+    tx_buf: Vec<u8>,
+    /// Read timeout currently set on the socket
+    read_timeout_ms: u64,
 }
 
 impl TcpTransport {
@@ -40,7 +44,9 @@ impl TcpTransport {
 
         Ok(Self {
             stream,
-            decoder: FrameDecoder::new(),
+            reader: FrameReader::new(),
+            tx_buf: Vec::new(),
+            read_timeout_ms: DEFAULT_TIMEOUT_MS,
         })
     }
 
@@ -51,9 +57,9 @@ impl TcpTransport {
 
     /// Send a frame to the device
     pub fn send_frame(&mut self, msg_type: u8, payload: &[u8]) -> Result<()> {
-        let frame = encode_frame(msg_type, payload)?;
+        encode_frame_into(msg_type, payload, &mut self.tx_buf)?;
         self.stream
-            .write_all(&frame)
+            .write_all(&self.tx_buf)
             .context("Failed to write frame to TCP socket")?;
         self.stream.flush().context("Failed to flush TCP socket")?;
         Ok(())
@@ -61,37 +67,35 @@ impl TcpTransport {
 
     /// Receive a frame from the device with timeout
     pub fn receive_frame(&mut self, timeout_ms: u64) -> Result<Frame> {
-        self.decoder.reset();
-
-        // Set the read timeout for this receive
-        self.stream
-            .set_read_timeout(Some(Duration::from_millis(timeout_ms)))
-            .context("Failed to set read timeout")?;
+        self.reader.reset();
+
+        // Set the read timeout for this receive, if it changed
+        if timeout_ms != self.read_timeout_ms {
+            self.stream
+                .set_read_timeout(Some(Duration::from_millis(timeout_ms)))
+                .context("Failed to set read timeout")?;
+            self.read_timeout_ms = timeout_ms;
+        }
 
         let start = std::time::Instant::now();
         let timeout = Duration::from_millis(timeout_ms);
 
-        let mut buf = [0u8; 1];
-
         loop {
+            // Buffered bytes may hold the start of this frame (or all of it)
+            if let Some(result) = self.reader.next_buffered() {
+                return result.map_err(|e| anyhow::anyhow!("Frame decode error: {}", e));
+            }
+
             if start.elapsed() > timeout {
                 anyhow::bail!("Timeout waiting for response");
             }
 
-            match self.stream.read(&mut buf) {
-                Ok(1) => {
-                    if let Some(result) = self.decoder.feed_byte(buf[0]) {
-                        return result.map_err(|e| anyhow::anyhow!("Frame decode error: {}", e));
-                    }
-                }
+            match self.reader.fill(&mut self.stream) {
                 Ok(0) => {
                     // Connection closed
                     anyhow::bail!("Connection closed by peer");
                 }
-                Ok(_) => {
-                    // Unexpected: more bytes than buffer size (shouldn't happen with 1-byte buffer)
-                    continue;
-                }
+                Ok(_) => {}
                 Err(e) if e.kind() == std::io::ErrorKind::TimedOut => {
                     // Continue loop and check overall timeout
                     continue;
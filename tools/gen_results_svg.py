@@ -2,6 +2,21 @@
 """Generate SVG drill results visualization."""
 import sys
 
+# Per-round templates for the bar loop
+ROUND_LABEL_TMPL = ('<text x="%d" y="%d" text-anchor="end" fill="#8b949e"'
+                    ' font-size="10">R%d</text>')
+BAR_TMPL = '<rect x="%d" y="%d" width="%.1f" height="%d" rx="3" fill="%s" opacity="0.75"/>'
+BAR_POD_TMPL = ('<text x="%d" y="%d" fill="#0d1117" font-size="10" font-weight="600">'
+                'Pod %d</text>')
+BAR_TIME_TMPL = ('<text x="%s" y="%d" text-anchor="end" fill="#0d1117" font-size="10">'
+                 '%.0fms</text>')
+BAR_OUTSIDE_TMPL = '<text x="%s" y="%d" fill="%s" font-size="10">Pod %d \u2022 %.0fms</text>'
+MISS_BAR_TMPL = '<rect x="%d" y="%d" width="%d" height="%d" rx="3" fill="#21262d" opacity="0.5"/>'
+MISS_LABEL_TMPL = ('<text x="%d" y="%d" fill="#f85149" font-size="10" font-weight="600">'
+                   'Pod %d \u2014 MISS (timeout)</text>')
+MISS_MARK_TMPL = ('<text x="%d" y="%d" text-anchor="end" fill="#f85149"'
+                  ' font-size="12">\u2717</text>')
+
 def main():
     output_path = sys.argv[1] if len(sys.argv) > 1 else "sim_results.svg"
 
@@ -34,6 +49,24 @@ def main():
     chart_width = width - margin_left - margin_right
     max_reaction = 300  # ms scale
 
+    # Aggregate every statistic in one pass over the rounds. Pod ids are
+    # small integers, so per-pod counters live in lists indexed by id.
+    pod_count = max(r[0] for r in rounds) + 1
+    pod_hits = [0] * pod_count
+    pod_total = [0] * pod_count
+    pod_time = [0.0] * pod_count
+    best = float("inf")
+    worst = 0.0
+    for pod, hit, react, pad, phase in rounds:
+        pod_total[pod] += 1
+        if hit:
+            pod_hits[pod] += 1
+            pod_time[pod] += react
+            if react < best:
+                best = react
+            if react > worst:
+                worst = react
+
     parts = []
     parts.append(f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}"'
                  f' style="background:#0d1117;font-family:\'Segoe UI\',Roboto,monospace">')
@@ -43,12 +76,12 @@ def main():
                  f' font-size="15" font-weight="600">Drill Results — Reaction Times</text>')
 
     # Stats row
-    hits = sum(1 for r in rounds if r[1])
+    hits = sum(pod_hits)
     misses = len(rounds) - hits
-    avg = sum(r[2] for r in rounds if r[1]) / hits
+    avg = sum(pod_time) / hits
     parts.append(f'<text x="{width//2}" y="48" text-anchor="middle" fill="#8b949e" font-size="11">'
-                 f'15 Rounds \u2022 {hits} Hits \u2022 {misses} Misses \u2022'
-                 f' Avg: {avg:.1f}ms \u2022 Best: 45.0ms \u2022 Worst: 250.0ms</text>')
+                 f'{len(rounds)} Rounds \u2022 {hits} Hits \u2022 {misses} Misses \u2022'
+                 f' Avg: {avg:.1f}ms \u2022 Best: {best:.1f}ms \u2022 Worst: {worst:.1f}ms</text>')
 
     # Phase labels
     phases = [("Warm-up", 0, 5, "#66BB6A"), ("Speed", 5, 5, "#FFA726"), ("Sprint", 10, 5, "#EF5350")]
@@ -71,64 +104,52 @@ def main():
 
     # Bars
     phase_colors = {"green": "#66BB6A", "yellow": "#FFA726", "red": "#EF5350"}
+    row_pitch = bar_height + bar_gap
+    text_dy = bar_height // 2 + 4
+    label_x = margin_left - 8
+    inner_x = margin_left + 8
+    mark_x = margin_left + chart_width - 10
+    append = parts.append
     for i, (pod, hit, react_ms, pad, phase) in enumerate(rounds):
-        y = margin_top + i * (bar_height + bar_gap)
+        y = margin_top + i * row_pitch
+        text_y = y + text_dy
         color = phase_colors[phase]
 
         # Round label
-        parts.append(f'<text x="{margin_left - 8}" y="{y + bar_height // 2 + 4}"'
-                     f' text-anchor="end" fill="#8b949e" font-size="10">R{i}</text>')
+        append(ROUND_LABEL_TMPL % (label_x, text_y, i))
 
         if hit:
             bar_w = (react_ms / max_reaction) * chart_width
             # Gradient bar
-            parts.append(f'<rect x="{margin_left}" y="{y}" width="{bar_w:.1f}"'
-                         f' height="{bar_height}" rx="3" fill="{color}" opacity="0.75"/>')
+            append(BAR_TMPL % (margin_left, y, bar_w, bar_height, color))
             # Pod label inside bar
             if bar_w > 80:
-                parts.append(f'<text x="{margin_left + 8}" y="{y + bar_height // 2 + 4}"'
-                             f' fill="#0d1117" font-size="10" font-weight="600">'
-                             f'Pod {pod}</text>')
-                parts.append(f'<text x="{margin_left + bar_w - 8}" y="{y + bar_height // 2 + 4}"'
-                             f' text-anchor="end" fill="#0d1117" font-size="10">'
-                             f'{react_ms:.0f}ms</text>')
+                append(BAR_POD_TMPL % (inner_x, text_y, pod))
+                append(BAR_TIME_TMPL % (margin_left + bar_w - 8, text_y, react_ms))
             else:
-                parts.append(f'<text x="{margin_left + bar_w + 5}" y="{y + bar_height // 2 + 4}"'
-                             f' fill="{color}" font-size="10">'
-                             f'Pod {pod} \u2022 {react_ms:.0f}ms</text>')
+                append(BAR_OUTSIDE_TMPL % (margin_left + bar_w + 5, text_y, color, pod, react_ms))
         else:
             # Miss indicator
-            parts.append(f'<rect x="{margin_left}" y="{y}" width="{chart_width}"'
-                         f' height="{bar_height}" rx="3" fill="#21262d" opacity="0.5"/>')
-            parts.append(f'<text x="{margin_left + 8}" y="{y + bar_height // 2 + 4}"'
-                         f' fill="#f85149" font-size="10" font-weight="600">'
-                         f'Pod {pod} \u2014 MISS (timeout)</text>')
+            append(MISS_BAR_TMPL % (margin_left, y, chart_width, bar_height))
+            append(MISS_LABEL_TMPL % (inner_x, text_y, pod))
             # X marks
-            parts.append(f'<text x="{margin_left + chart_width - 10}"'
-                         f' y="{y + bar_height // 2 + 4}" text-anchor="end"'
-                         f' fill="#f85149" font-size="12">\u2717</text>')
+            append(MISS_MARK_TMPL % (mark_x, text_y))
 
     # Pod distribution summary at bottom
     summary_y = margin_top + len(rounds) * (bar_height + bar_gap) + 25
     parts.append(f'<text x="{width//2}" y="{summary_y}" text-anchor="middle"'
                  f' fill="#8b949e" font-size="11">Per-Pod Hit Rate:</text>')
-    pod_stats = {}
-    for pod, hit, react, pad, phase in rounds:
-        if pod not in pod_stats:
-            pod_stats[pod] = {"hits": 0, "total": 0, "times": []}
-        pod_stats[pod]["total"] += 1
-        if hit:
-            pod_stats[pod]["hits"] += 1
-            pod_stats[pod]["times"].append(react)
-
     sx = width // 2 - 200
-    for pod in sorted(pod_stats.keys()):
-        s = pod_stats[pod]
-        pct = s["hits"] / s["total"] * 100
-        avg_t = sum(s["times"]) / len(s["times"]) if s["times"] else 0
+    for pod in range(pod_count):
+        total = pod_total[pod]
+        if not total:
+            continue
+        hits_p = pod_hits[pod]
+        pct = hits_p / total * 100
+        avg_t = pod_time[pod] / hits_p if hits_p else 0
         color = "#66BB6A" if pct == 100 else "#FFA726" if pct >= 50 else "#EF5350"
         parts.append(f'<text x="{sx}" y="{summary_y + 20}" fill="{color}" font-size="10">'
-                     f'Pod {pod}: {s["hits"]}/{s["total"]} ({pct:.0f}%)'
+                     f'Pod {pod}: {hits_p}/{total} ({pct:.0f}%)'
                      f' avg={avg_t:.0f}ms</text>')
         sx += 160
 
@@ -2,30 +2,74 @@
 """Generate SVG timeline visualization from Perfetto trace JSON."""
 import json
 import sys
+from collections import deque
+
+try:
+    import ijson
+except ImportError:  # optional: stream-parse large traces when available
+    ijson = None
+
+# Per-event templates for the instant-event and flow-arrow loops
+DOT_TMPL = '<circle cx="%.1f" cy="%d" r="%d" fill="%s" opacity="%s"/>'
+DOT_LABEL_TMPL = ('<text x="%.1f" y="%d" text-anchor="middle" fill="%s" font-size="7"'
+                  ' opacity="0.7">%s</text>')
+FLOW_TMPL = ('<line x1="%.1f" y1="%d" x2="%.1f" y2="%d" stroke="%s" stroke-width="1"'
+             ' opacity="0.35" marker-end="url(#arr)"/>')
+
+def iter_trace_events(path):
+    """Yield trace events, streaming them from disk when ijson is installed."""
+    if ijson is not None:
+        with open(path, "rb") as f:
+            yield from ijson.items(f, "traceEvents.item", use_float=True)
+    else:
+        with open(path) as f:
+            yield from json.load(f)["traceEvents"]
 
 def main():
     input_path = sys.argv[1] if len(sys.argv) > 1 else "sim_trace.json"
     output_path = sys.argv[2] if len(sys.argv) > 2 else "sim_timeline.svg"
 
-    with open(input_path) as f:
-        data = json.load(f)
-
-    events = data["traceEvents"]
-
-    # Find pod count from metadata events
+    # Single pass over the trace: gather everything the renderer needs so
+    # the drawing code below only touches the categorized lists
     pod_names = {}
-    for e in events:
-        if e.get("ph") == "M" and e.get("name") == "process_name":
-            pod_names[e["pid"]] = e["args"]["name"]
+    min_ts = max_ts = None
+    simlog_count = flow_count = trace_count = 0
+    instants = []
+    flow_starts = {}
+    flow_ends = []
+    for e in iter_trace_events(input_path):
+        ph = e.get("ph")
+        if ph == "M":
+            if e.get("name") == "process_name":
+                pod_names[e["pid"]] = e["args"]["name"]
+            continue
+        has_ts = "ts" in e
+        if has_ts:
+            ts = e["ts"]
+            if min_ts is None:
+                min_ts = max_ts = ts
+            elif ts < min_ts:
+                min_ts = ts
+            elif ts > max_ts:
+                max_ts = ts
+        if ph == "i":
+            if e.get("tid") == 100:
+                simlog_count += 1
+            if has_ts:
+                instants.append(e)
+        elif ph == "s":
+            flow_count += 1
+            flow_starts.setdefault(e.get("id"), deque()).append(e)
+        elif ph == "f":
+            flow_ends.append(e)
+        elif ph in ("B", "E"):
+            trace_count += 1
     pod_count = max(pod_names.keys()) + 1 if pod_names else 0
 
-    # Find time range from timed events
-    times = [e["ts"] for e in events if "ts" in e and e.get("ph") not in ("M",)]
-    if not times:
+    # Time range from timed events
+    if min_ts is None:
         print("No timed events found")
         sys.exit(1)
-    min_ts = min(times)
-    max_ts = max(times)
     time_range = max_ts - min_ts if max_ts > min_ts else 1
 
     # Layout constants
@@ -53,153 +97,148 @@ def main():
     # Y-offsets within each pod lane by category
     y_offsets = {"espnow": 30, "cmd": 45, "drill": 60, "feedback": 75, "led": 75, "audio": 90}
 
-    parts = []
-    parts.append(f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{svg_height}"'
-                 f' style="background:#0d1117;font-family:\'Segoe UI\',Roboto,monospace">')
-
-    # Arrow marker
-    parts.append('<defs>')
-    parts.append('  <marker id="arr" viewBox="0 0 10 10" refX="10" refY="5"'
-                 ' markerWidth="5" markerHeight="5" orient="auto">'
-                 '<path d="M0 0 L10 5 L0 10z" fill="#555"/></marker>')
-    parts.append('  <linearGradient id="hdr" x1="0" y1="0" x2="0" y2="1">'
-                 '<stop offset="0%" stop-color="#1a2332"/>'
-                 '<stop offset="100%" stop-color="#0d1117"/></linearGradient>')
-    parts.append('</defs>')
-
-    # Header
-    parts.append(f'<rect x="0" y="0" width="{width}" height="{header_height}" fill="url(#hdr)"/>')
-    parts.append(f'<text x="{width//2}" y="25" text-anchor="middle" fill="#e6edf3"'
-                 f' font-size="15" font-weight="600">'
-                 f'DOMES Multi-Pod Drill Simulation</text>')
-
-    # Count stats
-    simlog_count = sum(1 for e in events if e.get("ph") == "i" and e.get("tid") == 100)
-    flow_count = sum(1 for e in events if e.get("ph") == "s")
-    trace_count = sum(1 for e in events if e.get("ph") in ("B", "E"))
-
-    parts.append(f'<text x="{width//2}" y="42" text-anchor="middle" fill="#8b949e" font-size="11">'
-                 f'5 Pods \u2022 15 Rounds \u2022 12 Hits / 3 Misses \u2022'
-                 f' Avg Reaction: 116.7ms</text>')
-    parts.append(f'<text x="{width//2}" y="57" text-anchor="middle" fill="#6e7681" font-size="10">'
-                 f'{simlog_count} SimLog events \u2022 {flow_count} ESP-NOW flows \u2022'
-                 f' {trace_count} trace spans \u2022'
-                 f' Timeline: {min_ts/1000:.0f}ms \u2013 {max_ts/1000:.0f}ms</text>')
-
-    # Pod lanes
-    for pid in range(pod_count):
-        y_base = header_height + pid * pod_height
-        bg = "#161b22" if pid % 2 == 0 else "#0d1117"
-        parts.append(f'<rect x="0" y="{y_base}" width="{width}" height="{pod_height}" fill="{bg}"/>')
-        # Lane label
-        parts.append(f'<text x="15" y="{y_base + 22}" fill="#58a6ff" font-size="13"'
-                     f' font-weight="600">{pod_names.get(pid, f"Pod {pid}")}</text>')
-        if pid == 0:
-            parts.append(f'<text x="60" y="{y_base + 22}" fill="#484f58" font-size="9">'
-                         f'(master/orchestrator)</text>')
-        # Separator
-        parts.append(f'<line x1="0" y1="{y_base + pod_height}" x2="{width}"'
-                     f' y2="{y_base + pod_height}" stroke="#21262d" stroke-width="1"/>')
-        # Sub-lane labels
-        for cat, yoff in [("espnow", 30), ("cmd", 45), ("drill/fb", 68), ("audio", 90)]:
-            parts.append(f'<text x="{margin_left - 5}" y="{y_base + yoff + 3}"'
-                         f' text-anchor="end" fill="#30363d" font-size="8">{cat}</text>')
-
-    # Time grid
-    for i in range(21):
-        ts = min_ts + (time_range * i / 20)
-        xp = x_pos(ts)
-        parts.append(f'<line x1="{xp:.1f}" y1="{header_height}" x2="{xp:.1f}"'
-                     f' y2="{header_height + pod_count * pod_height}"'
-                     f' stroke="#21262d" stroke-width="0.5"/>')
-        if i % 2 == 0:
-            parts.append(f'<text x="{xp:.1f}" y="{header_height + pod_count * pod_height + 15}"'
-                         f' text-anchor="middle" fill="#484f58" font-size="8">{ts/1000:.0f}ms</text>')
-
-    # SimLog instant events
-    for e in events:
-        if e.get("ph") != "i" or "ts" not in e:
-            continue
-        pid = e.get("pid", 0)
-        if pid >= pod_count:
-            continue
-        y_base = header_height + pid * pod_height
-        xp = x_pos(e["ts"])
-        cat = e.get("name", "")
-        color = cat_colors.get(cat, "#555")
-        y_off = y_offsets.get(cat, 50)
-        msg = e.get("args", {}).get("msg", "")
-
-        # Larger dots for important events
-        r = 4 if cat in ("drill", "feedback") else 3
-        opacity = "0.9" if cat in ("drill", "feedback", "cmd") else "0.6"
-        parts.append(f'<circle cx="{xp:.1f}" cy="{y_base + y_off}" r="{r}"'
-                     f' fill="{color}" opacity="{opacity}"/>')
-
-        # Labels for drill events
-        if cat == "drill" and ("ARM" in msg):
-            label = "ARM" if "master" in msg else "arm"
-            parts.append(f'<text x="{xp:.1f}" y="{y_base + y_off - 6}"'
-                         f' text-anchor="middle" fill="{color}" font-size="7"'
-                         f' opacity="0.7">{label}</text>')
-
-    # Flow arrows (ESP-NOW messages between pods)
-    flow_starts = {}
-    for e in events:
-        if e.get("ph") == "s":
-            fid = e.get("id")
-            flow_starts.setdefault(fid, []).append(e)
-
-    for e in events:
-        if e.get("ph") != "f":
-            continue
-        fid = e.get("id")
-        starts = flow_starts.get(fid, [])
-        if not starts:
-            continue
-        s = starts.pop(0)
-        src_pid = s["pid"]
-        dst_pid = e["pid"]
-        if src_pid >= pod_count or dst_pid >= pod_count:
-            continue
-        xp = x_pos(s["ts"])
-        y1 = header_height + src_pid * pod_height + 30
-        y2 = header_height + dst_pid * pod_height + 30
-        name = s.get("name", "")
-        if "JOIN" in name:
-            color = "#42A5F5"
-        elif "COLOR" in name or "ARM" in name:
-            color = "#66BB6A"
-        elif "TOUCH" in name or "TIMEOUT" in name:
-            color = "#EF5350"
-        elif "STOP" in name:
-            color = "#FFA726"
-        else:
-            color = "#555"
-        parts.append(f'<line x1="{xp:.1f}" y1="{y1}" x2="{xp + 0.5:.1f}" y2="{y2}"'
-                     f' stroke="{color}" stroke-width="1" opacity="0.35"'
-                     f' marker-end="url(#arr)"/>')
-
-    # Legend
-    legend_y = header_height + pod_count * pod_height + 35
-    legend_items = [
-        ("ESP-NOW", "#42A5F5"), ("Command", "#66BB6A"), ("Drill", "#EF5350"),
-        ("Feedback", "#FFA726"), ("LED", "#FF7043"), ("Audio", "#AB47BC"),
-        ("\u2192 Flow arrow", "#555"),
-    ]
-    lx = margin_left
-    for name, color in legend_items:
-        parts.append(f'<circle cx="{lx}" cy="{legend_y}" r="4" fill="{color}"/>')
-        parts.append(f'<text x="{lx + 8}" y="{legend_y + 4}" fill="#8b949e" font-size="9">'
-                     f'{name}</text>')
-        lx += len(name) * 7 + 30
-
-    parts.append("</svg>")
-
-    svg = "\n".join(parts)
-    with open(output_path, "w") as f:
-        f.write(svg)
-    print(f"SVG written to {output_path} ({len(svg)} bytes)")
+    # Stream markup straight to disk; the buffer coalesces the small writes
+    with open(output_path, "wb", buffering=1 << 20) as f:
+        write = f.write
+
+        def emit(line):
+            write(line.encode("utf-8"))
+            write(b"\n")
+
+        emit(f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{svg_height}"'
+             f' style="background:#0d1117;font-family:\'Segoe UI\',Roboto,monospace">')
+
+        # Arrow marker
+        emit('<defs>')
+        emit('  <marker id="arr" viewBox="0 0 10 10" refX="10" refY="5"'
+             ' markerWidth="5" markerHeight="5" orient="auto">'
+             '<path d="M0 0 L10 5 L0 10z" fill="#555"/></marker>')
+        emit('  <linearGradient id="hdr" x1="0" y1="0" x2="0" y2="1">'
+             '<stop offset="0%" stop-color="#1a2332"/>'
+             '<stop offset="100%" stop-color="#0d1117"/></linearGradient>')
+        emit('</defs>')
+
+        # Header
+        emit(f'<rect x="0" y="0" width="{width}" height="{header_height}" fill="url(#hdr)"/>')
+        emit(f'<text x="{width//2}" y="25" text-anchor="middle" fill="#e6edf3"'
+             f' font-size="15" font-weight="600">'
+             f'DOMES Multi-Pod Drill Simulation</text>')
+
+        emit(f'<text x="{width//2}" y="42" text-anchor="middle" fill="#8b949e" font-size="11">'
+             f'5 Pods \u2022 15 Rounds \u2022 12 Hits / 3 Misses \u2022'
+             f' Avg Reaction: 116.7ms</text>')
+        emit(f'<text x="{width//2}" y="57" text-anchor="middle" fill="#6e7681" font-size="10">'
+             f'{simlog_count} SimLog events \u2022 {flow_count} ESP-NOW flows \u2022'
+             f' {trace_count} trace spans \u2022'
+             f' Timeline: {min_ts/1000:.0f}ms \u2013 {max_ts/1000:.0f}ms</text>')
+
+        # Pod lanes
+        for pid in range(pod_count):
+            y_base = header_height + pid * pod_height
+            bg = "#161b22" if pid % 2 == 0 else "#0d1117"
+            emit(f'<rect x="0" y="{y_base}" width="{width}" height="{pod_height}" fill="{bg}"/>')
+            # Lane label
+            emit(f'<text x="15" y="{y_base + 22}" fill="#58a6ff" font-size="13"'
+                 f' font-weight="600">{pod_names.get(pid, f"Pod {pid}")}</text>')
+            if pid == 0:
+                emit(f'<text x="60" y="{y_base + 22}" fill="#484f58" font-size="9">'
+                     f'(master/orchestrator)</text>')
+            # Separator
+            emit(f'<line x1="0" y1="{y_base + pod_height}" x2="{width}"'
+                 f' y2="{y_base + pod_height}" stroke="#21262d" stroke-width="1"/>')
+            # Sub-lane labels
+            for cat, yoff in [("espnow", 30), ("cmd", 45), ("drill/fb", 68), ("audio", 90)]:
+                emit(f'<text x="{margin_left - 5}" y="{y_base + yoff + 3}"'
+                     f' text-anchor="end" fill="#30363d" font-size="8">{cat}</text>')
+
+        # Time grid
+        for i in range(21):
+            ts = min_ts + (time_range * i / 20)
+            xp = x_pos(ts)
+            emit(f'<line x1="{xp:.1f}" y1="{header_height}" x2="{xp:.1f}"'
+                 f' y2="{header_height + pod_count * pod_height}"'
+                 f' stroke="#21262d" stroke-width="0.5"/>')
+            if i % 2 == 0:
+                emit(f'<text x="{xp:.1f}" y="{header_height + pod_count * pod_height + 15}"'
+                     f' text-anchor="middle" fill="#484f58" font-size="8">{ts/1000:.0f}ms</text>')
+
+        # Lane y positions and per-category dot styles, resolved once
+        pod_y = [header_height + p * pod_height for p in range(pod_count)]
+        default_style = ("#555", 50, 3, "0.6")
+        cat_style = {
+            cat: (cat_colors.get(cat, "#555"), y_offsets.get(cat, 50),
+                  4 if cat in ("drill", "feedback") else 3,
+                  "0.9" if cat in ("drill", "feedback", "cmd") else "0.6")
+            for cat in cat_colors.keys() | y_offsets.keys()
+        }
+        style_get = cat_style.get
+
+        # SimLog instant events
+        for e in instants:
+            get = e.get
+            pid = get("pid", 0)
+            if pid >= pod_count:
+                continue
+            cat = get("name", "")
+            # Larger dots for important events
+            color, y_off, r, opacity = style_get(cat, default_style)
+            cy = pod_y[pid] + y_off
+            xp = x_pos(e["ts"])
+            emit(DOT_TMPL % (xp, cy, r, color, opacity))
+
+            # Labels for drill events
+            if cat == "drill":
+                msg = get("args", {}).get("msg", "")
+                if "ARM" in msg:
+                    label = "ARM" if "master" in msg else "arm"
+                    emit(DOT_LABEL_TMPL % (xp, cy - 6, color, label))
+
+        # Flow arrows (ESP-NOW messages between pods)
+        flow_y = [y + 30 for y in pod_y]
+        starts_get = flow_starts.get
+        for e in flow_ends:
+            starts = starts_get(e.get("id"))
+            if not starts:
+                continue
+            s = starts.popleft()
+            src_pid = s["pid"]
+            dst_pid = e["pid"]
+            if src_pid >= pod_count or dst_pid >= pod_count:
+                continue
+            xp = x_pos(s["ts"])
+            y1 = flow_y[src_pid]
+            y2 = flow_y[dst_pid]
+            name = s.get("name", "")
+            if "JOIN" in name:
+                color = "#42A5F5"
+            elif "COLOR" in name or "ARM" in name:
+                color = "#66BB6A"
+            elif "TOUCH" in name or "TIMEOUT" in name:
+                color = "#EF5350"
+            elif "STOP" in name:
+                color = "#FFA726"
+            else:
+                color = "#555"
+            emit(FLOW_TMPL % (xp, y1, xp + 0.5, y2, color))
+
+        # Legend
+        legend_y = header_height + pod_count * pod_height + 35
+        legend_items = [
+            ("ESP-NOW", "#42A5F5"), ("Command", "#66BB6A"), ("Drill", "#EF5350"),
+            ("Feedback", "#FFA726"), ("LED", "#FF7043"), ("Audio", "#AB47BC"),
+            ("\u2192 Flow arrow", "#555"),
+        ]
+        lx = margin_left
+        for name, color in legend_items:
+            emit(f'<circle cx="{lx}" cy="{legend_y}" r="4" fill="{color}"/>')
+            emit(f'<text x="{lx + 8}" y="{legend_y + 4}" fill="#8b949e" font-size="9">'
+                 f'{name}</text>')
+            lx += len(name) * 7 + 30
+
+        write(b"</svg>")
+        total_bytes = f.tell()
+
+    print(f"SVG written to {output_path} ({total_bytes} bytes)")
 
 if __name__ == "__main__":
     main()